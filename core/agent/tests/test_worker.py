@@ -991,6 +991,15 @@ def test_build_card_prompt_composes_governed_polish_and_tag_rules():
     assert "POLISH-DIFFERENT" in p2 and "POLISH-X" not in p2
 
 
+def test_build_card_prompt_keeps_transcript_window_last():
+    """Beats of one meeting differ only in the window, so the prompt prefix before it is identical."""
+    a = build_card_prompt("[Jane] hi", ["person"], steering="Ignore small talk.")
+    b = build_card_prompt("[Jane] hi\n[Bob] hello there", ["person"], steering="Ignore small talk.")
+    prefix = a[: -len("[Jane] hi")]
+    assert a.endswith("[Jane] hi") and b.startswith(prefix)
+    assert "Ignore small talk." in prefix
+
+
 def test_build_card_prompt_uses_config_from_meeting_md(tmp_path):
     """The fields flow from agents/meeting.md → MeetingConfig → build_card_prompt end to end."""
     from shared.agent_config import load_meeting_config
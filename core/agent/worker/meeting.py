@@ -57,12 +57,14 @@ log = logging.getLogger("agent_api.worker")
 # copilot behavior by prompting the agent to edit agents/meeting.md, no redeploy.
 
 # The fixed frame around the workspace policy. `{polish}` / `{tags}` are the governed rules; `{kinds}` is
-# the wanted card kinds; `{steering}` is the (optional) free-text steering section.
+# the wanted card kinds; `{steering}` is the (optional) free-text steering section. The transcript `{lines}`
+# go LAST: everything before them is constant for a meeting's config, so consecutive beats share a
+# byte-identical prompt prefix a provider-side prompt cache can reuse (only the window changes per beat).
 _CARD_FRAME = (
-    "You are a live meeting copilot watching a conversation in real time. Here is the mutable transcript "
-    "processing window. Each line is sent through at most three passes; pass 1 is fresh, pass 2 should "
-    "repair obvious ASR/name/entity errors, and pass 3 should be the final clean version before the line "
-    "freezes and leaves this window.\n\n{lines}\n\n"
+    "You are a live meeting copilot watching a conversation in real time. At the end of this message is "
+    "the mutable transcript processing window. Each line is sent through at most three passes; pass 1 is "
+    "fresh, pass 2 should repair obvious ASR/name/entity errors, and pass 3 should be the final clean "
+    "version before the line freezes and leaves this window.\n\n"
     "Return a processed transcript plus tag cards. For each input line, emit one note with the SAME id "
     "and speaker, following the POLISH RULES below.\n\n"
     "## Polish rules (governed by this workspace)\n{polish}\n\n"
@@ -73,13 +75,14 @@ _CARD_FRAME = (
     "Respond with ONLY this JSON object (no prose, no markdown fence, and do NOT write any files):\n"
     "{{\"notes\":[{{\"id\":\"<input id>\",\"speaker\":\"<speaker>\",\"chapter\":\"\",\"text\":\"<clean one-line note>\"}}],"
     "\"cards\":[{{\"kind\":\"<one of {kinds}>\",\"title\":\"<short>\",\"body\":\"<one line>\",\"actionable\":true}}]}}\n"
-    "Use an empty cards array if these specific lines add no tags.{steering}"
+    "Use an empty cards array if these specific lines add no tags.{steering}\n\n"
+    "## Transcript processing window\n{lines}"
 )
 
 # Appended to the frame only when the workspace config carries non-empty steering.
 _STEERING_SECTION = (
     "\n\n## Standing instructions from this workspace\n"
-    "Follow these workspace-set instructions about what to watch / ignore / tone:\n\n{steering}\n"
+    "Follow these workspace-set instructions about what to watch / ignore / tone:\n\n{steering}"
 )
 
 
@@ -255,13 +258,17 @@ def meeting_card_turn(
     ``completion`` is injectable; by default it resolves through the ``worker.worker``
     ``completion_factory`` seam (env-selected adapter, ``VEXA_LLM_PROVIDER``)."""
     kinds = card_kinds or list(DEFAULT_CARD_KINDS)
-    segment_by_id = {str(s.get("segment_id") or s.get("id") or ""): s for s in segments}
-    stage_by_id = {seg_id: int(s.get("rewrite_pass") or 1) for seg_id, s in segment_by_id.items()}
-    lines = "\n".join(
-        f"[pass {int(s.get('rewrite_pass') or 1)}/3 id={s.get('segment_id') or s.get('id') or '?'} "
-        f"speaker={s.get('speaker', '?')}] {s.get('text', '')}"
-        for s in segments
-    )
+    # One pass over the window: resolve each segment's id + pass once for the lookups AND the prompt line.
+    segment_by_id: dict[str, dict] = {}
+    stage_by_id: dict[str, int] = {}
+    rows: list[str] = []
+    for s in segments:
+        seg_id = str(s.get("segment_id") or s.get("id") or "")
+        stage = int(s.get("rewrite_pass") or 1)
+        segment_by_id[seg_id] = s
+        stage_by_id[seg_id] = stage
+        rows.append(f"[pass {stage}/3 id={seg_id or '?'} speaker={s.get('speaker', '?')}] {s.get('text', '')}")
+    lines = "\n".join(rows)
     prompt = build_card_prompt(lines, kinds, steering, polish_rules=polish_rules, tag_rules=tag_rules)
     # We DON'T forward raw model output as turn events — the JSON reply would leak into the UI as a
     # "note"; the meeting feed wants only the parsed notes/cards.
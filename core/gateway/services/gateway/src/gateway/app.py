@@ -690,6 +690,19 @@ def create_app(
     return app
 
 
+# Constant /ws control frames, encoded once at import. ``ping`` is the keepalive every client sends on
+# a timer, so the ``pong`` beat (and the fixed error frames) skip a dict build + json.dumps per send.
+_WS_PONG = json.dumps({"type": "pong"})
+_WS_ERR_INVALID_JSON = json.dumps({"type": "error", "error": "invalid_json"})
+_WS_ERR_UNKNOWN_ACTION = json.dumps({"type": "error", "error": "unknown_action"})
+_WS_ERR_MISSING_API_KEY = json.dumps({"type": "error", "error": "missing_api_key"})
+_WS_ERR_AUTH_UNAVAILABLE = json.dumps({"type": "error", "error": "auth_unavailable"})
+_WS_ERR_INVALID_API_KEY = json.dumps({"type": "error", "error": "invalid_api_key"})
+
+# Upper bound on how long a closing /ws waits for its cancelled fan-ins to unsubscribe + close pubsub.
+_WS_FANIN_CLOSE_TIMEOUT_S = 5.0
+
+
 async def run_multiplex(ws: WebSocket, authorizer: Authorizer, redis: RedisBus) -> None:
     """The ``/ws`` control loop + fan-in, carved verbatim from main.websocket_multiplex.
 
@@ -733,7 +746,7 @@ async def run_multiplex(ws: WebSocket, authorizer: Authorizer, redis: RedisBus)
     api_key = ws.headers.get("x-api-key") or ws.query_params.get("api_key")
     if not api_key:
         try:
-            await ws.send_text(json.dumps({"type": "error", "error": "missing_api_key"}))
+            await ws.send_text(_WS_ERR_MISSING_API_KEY)
         finally:
             await ws.close(code=4401)  # Unauthorized
         return
@@ -754,13 +767,13 @@ async def run_multiplex(ws: WebSocket, authorizer: Authorizer, redis: RedisBus)
         log_event("auth_infra_unavailable", audience="system", level="error", span="ws",
                   fields={"reason": type(e).__name__, "detail": str(e)})
         try:
-            await ws.send_text(json.dumps({"type": "error", "error": "auth_unavailable"}))
+            await ws.send_text(_WS_ERR_AUTH_UNAVAILABLE)
         finally:
             await ws.close(code=4503)  # retry later — auth infrastructure unavailable
         return
     if not user_data:
         try:
-            await ws.send_text(json.dumps({"type": "error", "error": "invalid_api_key"}))
+            await ws.send_text(_WS_ERR_INVALID_API_KEY)
         finally:
             await ws.close(code=4401)  # Unauthorized
         return
@@ -769,11 +782,15 @@ async def run_multiplex(ws: WebSocket, authorizer: Authorizer, redis: RedisBus)
 
     sub_tasks: Dict[Tuple, asyncio.Task] = {}
     subscribed_meetings: Set[Tuple] = set()
+    # Fan-ins cancelled by an explicit unsubscribe, still running their pubsub cleanup. Kept so the
+    # disconnect teardown awaits them too; each drops out of the set once it has finished.
+    unsubscribed_tasks: Set[asyncio.Task] = set()
 
     async def fan_in(channels: List[str]):
         pubsub = redis.pubsub()
-        await pubsub.subscribe(*channels)
         try:
+            # Inside the try: a cancel landing mid-subscribe must still release the pubsub.
+            await pubsub.subscribe(*channels)
             async for message in pubsub.listen():
                 if message.get("type") != "message":
                     continue
@@ -806,6 +823,8 @@ async def run_multiplex(ws: WebSocket, authorizer: Authorizer, redis: RedisBus)
         task = sub_tasks.pop(key, None)
         if task:
             task.cancel()
+            unsubscribed_tasks.add(task)
+            task.add_done_callback(unsubscribed_tasks.discard)
         subscribed_meetings.discard(key)
 
     # Auto-subscribe the authed socket to its USER scope (Track G — meeting-status-ws §C.2). The
@@ -827,12 +846,12 @@ async def run_multiplex(ws: WebSocket, authorizer: Authorizer, redis: RedisBus)
             try:
                 msg = json.loads(raw)
             except Exception:
-                await ws.send_text(json.dumps({"type": "error", "error": "invalid_json"}))
+                await ws.send_text(_WS_ERR_INVALID_JSON)
                 continue
             # Syntactically-valid but NON-OBJECT JSON ([1,2,3], 42, "x", null): guard before `.get()`,
             # else AttributeError escapes run_multiplex and KILLS the socket — a trivial public-edge DoS.
             if not isinstance(msg, dict):
-                await ws.send_text(json.dumps({"type": "error", "error": "invalid_json"}))
+                await ws.send_text(_WS_ERR_INVALID_JSON)
                 continue
 
             action = msg.get("action")
@@ -923,15 +942,20 @@ async def run_multiplex(ws: WebSocket, authorizer: Authorizer, redis: RedisBus)
                 await ws.send_text(json.dumps({"type": "unsubscribed", "meetings": unsubscribed}))
 
             elif action == "ping":
-                await ws.send_text(json.dumps({"type": "pong"}))
+                await ws.send_text(_WS_PONG)
             else:
-                await ws.send_text(json.dumps({"type": "error", "error": "unknown_action"}))
+                await ws.send_text(_WS_ERR_UNKNOWN_ACTION)
     except WebSocketDisconnect:
         pass
     finally:
-        user_sub_task.cancel()  # Track G — tear down the user-scope fan-in on disconnect.
-        for task in sub_tasks.values():
+        # Track G — tear down the user-scope fan-in on disconnect, with every live meeting fan-in.
+        # Wait (bounded) for their unsubscribe/close — and for fan-ins an explicit unsubscribe already
+        # cancelled (NOT re-cancelled: that would abort their in-flight cleanup) — so pubsub
+        # connections are released before the handler returns, not trailing a dead socket.
+        live = [user_sub_task, *sub_tasks.values()]
+        for task in live:
             task.cancel()
+        await asyncio.wait([*live, *unsubscribed_tasks], timeout=_WS_FANIN_CLOSE_TIMEOUT_S)
 
 
 # Backward-compatible private alias (kept so any existing internal reference still resolves; the
@@ -5,7 +5,8 @@ proving the carve of ``main.websocket_multiplex``:
   * missing api-key → missing_api_key error + close 4401,
   * subscribe → subscribed ack; a redis payload on a subscribed channel is forwarded RAW,
   * unsubscribe → unsubscribed ack AND the fan-in STOPS (later payloads are not forwarded),
-  * ping → pong; invalid_json / unknown_action error frames.
+  * ping → pong; invalid_json / unknown_action error frames,
+  * disconnect → every fan-in has released its pubsub before the handler returns.
 """
 from __future__ import annotations
 
@@ -15,7 +16,7 @@ from typing import Optional
 
 from gateway.app import _run_multiplex
 from gateway.ports import AuthUnavailable
-from conftest import FakeAuthorizer, FakeRedis
+from conftest import FakeAuthorizer, FakePubSub, FakeRedis
 
 API_KEY = "vxa_test_unit_key"
 AUTH_MAP = {("google_meet", "room-1"): {"meeting_id": 42, "user_id": 7}}
@@ -200,3 +201,61 @@ async def test_connect_auto_subscribes_user_channel_and_forwards():
 
     ws.disconnect()
     await task
+
+
+class _SlowUnsubscribePubSub(FakePubSub):
+    """Unsubscribe takes a few loop turns, like a real redis round-trip."""
+    async def unsubscribe(self, *channels: str) -> None:
+        for _ in range(5):
+            await asyncio.sleep(0)
+        await super().unsubscribe(*channels)
+
+
+class _SlowRedis(FakeRedis):
+    def pubsub(self) -> FakePubSub:
+        return _SlowUnsubscribePubSub(self)
+
+
+async def test_disconnect_releases_every_fan_in_before_returning():
+    # On disconnect the user-scope and per-meeting fan-ins are cancelled AND awaited: by the time
+    # run_multiplex returns, every pubsub has unsubscribed (no subscriber left on any channel).
+    ws = _WS(inbound=[SUBSCRIBE], api_key=API_KEY, close_when_drained=False)
+    redis = _SlowRedis()
+    auth = FakeAuthorizer(valid_key=API_KEY, auth_map=AUTH_MAP)
+    task = asyncio.ensure_future(_run_multiplex(ws, auth, redis))
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert redis._subs.get("u:7:meetings") and redis._subs.get("tc:meeting:42:mutable")
+
+    ws.disconnect()
+    await task
+    assert not any(redis._subs.values()), redis._subs
+
+
+async def test_disconnect_awaits_fan_ins_cancelled_by_unsubscribe():
+    # An unsubscribe cancels its fan-in; if the socket drops before that fan-in's slow cleanup has
+    # finished, teardown still waits for it — no channel subscriber outlives run_multiplex.
+    class _SlowerMeetingPubSub(FakePubSub):
+        async def unsubscribe(self, *channels: str) -> None:
+            # meeting cleanup outlasts the user-channel fan-in's, so only an explicit wait covers it
+            for _ in range(20 if any(c.startswith("tc:") for c in channels) else 1):
+                await asyncio.sleep(0)
+            await super().unsubscribe(*channels)
+
+    class _Redis(FakeRedis):
+        def pubsub(self) -> FakePubSub:
+            return _SlowerMeetingPubSub(self)
+
+    unsubscribe = {"action": "unsubscribe", "meetings": [{"platform": "google_meet", "native_id": "room-1"}]}
+    ws = _WS(inbound=[SUBSCRIBE], api_key=API_KEY, close_when_drained=False)
+    redis = _Redis()
+    auth = FakeAuthorizer(valid_key=API_KEY, auth_map=AUTH_MAP)
+    task = asyncio.ensure_future(_run_multiplex(ws, auth, redis))
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert redis._subs.get("tc:meeting:42:mutable")
+
+    ws._inbound.put_nowait(json.dumps(unsubscribe))
+    ws.disconnect()
+    await task
+    assert not any(redis._subs.values()), redis._subs
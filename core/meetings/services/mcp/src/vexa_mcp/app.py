@@ -18,6 +18,7 @@ conformance tests drive the SHIPPED app in-process with a fake gateway — the r
 from __future__ import annotations
 
 import os
+from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional
 
 import httpx
@@ -133,10 +134,22 @@ def create_app(
     """
     base_url = (gateway_url or os.getenv("GATEWAY_URL") or _DEFAULT_GATEWAY_URL).rstrip("/")
 
+    # One pooled client for the app's lifetime: tool calls reuse keep-alive connections to the
+    # gateway instead of paying a fresh TCP handshake per hop. Built at startup, on the serving
+    # loop its pool is bound to (not here, outside any loop), and closed at shutdown.
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI):
+        _app.state.gateway_client = httpx.AsyncClient(timeout=10, transport=transport)
+        try:
+            yield
+        finally:
+            await _app.state.gateway_client.aclose()
+
     _vexa_env = os.getenv("VEXA_ENV", "development")
     _public_docs = _vexa_env != "production"
     app = FastAPI(
         title="Vexa MCP Service (v0.12)",
+        lifespan=lifespan,
         docs_url="/docs" if _public_docs else None,
         redoc_url="/redoc" if _public_docs else None,
         openapi_url="/openapi.json" if _public_docs else None,
@@ -153,14 +166,13 @@ def create_app(
         params: Optional[dict] = None,
     ):
         try:
-            async with httpx.AsyncClient(timeout=10, transport=transport) as client:
-                response = await client.request(
-                    method, url, headers=get_headers(api_key), params=params, json=payload,
-                )
-                response.raise_for_status()
-                if not response.content:
-                    return {}
-                return response.json()
+            response = await app.state.gateway_client.request(
+                method, url, headers=get_headers(api_key), params=params, json=payload,
+            )
+            response.raise_for_status()
+            if not response.content:
+                return {}
+            return response.json()
         except httpx.HTTPStatusError as http_err:
             detail: Any
             try:
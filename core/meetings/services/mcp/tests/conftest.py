@@ -9,10 +9,11 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
 
 import httpx
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from vexa_mcp import create_app
@@ -46,9 +47,15 @@ def gateway() -> FakeGateway:
 
 
 @pytest.fixture
-def client(gateway: FakeGateway) -> TestClient:
-    app = create_app(GATEWAY_URL, transport=httpx.MockTransport(gateway.handler))
-    return TestClient(app)
+def app(gateway: FakeGateway) -> FastAPI:
+    return create_app(GATEWAY_URL, transport=httpx.MockTransport(gateway.handler))
+
+
+@pytest.fixture
+def client(app: FastAPI) -> Iterator[TestClient]:
+    # Entered, so the lifespan builds the shared gateway client on the TestClient's one loop.
+    with TestClient(app) as c:
+        yield c
 
 
 @pytest.fixture
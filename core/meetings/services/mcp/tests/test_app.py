@@ -3,6 +3,8 @@
 Asserts the seam the service exists for: every tool forwards to the RIGHT gateway path
 with the caller's key as X-API-Key, and auth is fail-closed (401 with a Bearer hint).
 """
+from fastapi.testclient import TestClient
+
 from conftest import API_KEY, FakeGateway
 
 
@@ -155,3 +157,22 @@ def test_downstream_error_propagates(client, gateway: FakeGateway, auth):
     r = client.get("/bot-status", headers=auth)
     assert r.status_code == 403
     assert "Insufficient scope" in str(r.json()["detail"])
+
+
+def test_gateway_client_is_shared_and_closed_on_shutdown(app, gateway, auth, monkeypatch):
+    assert not hasattr(app.state, "gateway_client")  # built at startup, on the serving loop
+    with TestClient(app) as c:
+        shared = app.state.gateway_client
+        calls = []
+        forward = shared.request
+
+        async def counting_request(*args, **kwargs):
+            calls.append(args)
+            return await forward(*args, **kwargs)
+
+        monkeypatch.setattr(shared, "request", counting_request)
+        c.get("/bot-status", headers=auth)
+        c.get("/meetings", headers=auth)
+        assert len(calls) == 2 and len(gateway.requests) == 2  # both hops rode the one client
+        assert app.state.gateway_client is shared and not shared.is_closed
+    assert shared.is_closed
@@ -154,7 +154,7 @@ def build_production_app():
 
         from .calendar_sync import fetch_configs, run_user_sync, store_stamp
 
-        configs = await fetch_configs(admin_api_url, internal_secret)
+        configs = await fetch_configs(admin_api_url, internal_secret, http=runtime_http)
         cfg = next((c for c in configs or [] if c.get("user_id") == user_id), None)
         if cfg is None:
             return None
@@ -196,7 +196,7 @@ def build_production_app():
 
     _attach_background_loops(
         app, transcript_store, segment_bus, redis_client, meeting_repo, runtime_client,
-        session_factory=session_factory,
+        session_factory=session_factory, http=runtime_http,
     )
     return app
 
@@ -212,10 +212,15 @@ def _minio_endpoint_url() -> str:
 
 def _attach_background_loops(
     app, transcript_store, segment_bus, redis_client, meeting_repo=None, runtime=None,
-    session_factory=None,
+    session_factory=None, http=None,
 ) -> None:
     """Register the FastAPI lifespan that starts/stops the control-plane poll loops.
 
+    ``http`` is the process-wide ``httpx.AsyncClient`` (the runtime-api pool): the loops that call
+    admin-api (auto-join's bot-context fetch, calendar-sync's configs fetch) reuse its keep-alive pool
+    instead of opening their own, and the lifespan closes it on shutdown. Without it (tests / fakes)
+    auto-join builds a loop-owned client and calendar-sync opens one per fetch.
+
     #637 — single-flight sweeps: at ``replicaCount>1`` every replica runs these same loops, so each
     live tick body is wrapped in a per-loop Postgres advisory lock (``_guarded``) — the real work runs
     once per interval, not once per replica. With no ``session_factory`` (Lite / a store without PG)
@@ -466,14 +471,20 @@ def _attach_background_loops(
         from .bot_spawn.auto_join import auto_join_tick
 
         fetch_bot_context = None
+        admin_http = None
         if admin_api_url and internal_secret:
+            # A sweep fetches bot-context per due row from the same admin-api host, so keep the
+            # connection alive across rows and ticks: the process-wide pool when wired, else one
+            # client for the loop's lifetime.
+            admin_http = http if http is not None else httpx.AsyncClient(timeout=10.0)
+
             async def fetch_bot_context(user_id: int):
                 try:
-                    async with httpx.AsyncClient(timeout=10.0) as client:
-                        r = await client.get(
-                            f"{admin_api_url}/internal/users/{user_id}/bot-context",
-                            headers={"X-Internal-Secret": internal_secret},
-                        )
+                    r = await admin_http.get(
+                        f"{admin_api_url}/internal/users/{user_id}/bot-context",
+                        headers={"X-Internal-Secret": internal_secret},
+                        timeout=10.0,
+                    )
                     if r.status_code != 200:
                         return None
                     body = r.json()
@@ -501,16 +512,20 @@ def _attach_background_loops(
                 allow_uncapped=auto_join_allow_uncapped,
             )
 
-        while True:
-            try:
-                # #637: one sweep per interval — the per-user spawn stays single-flighted by its own
-                # xact lock, but this also single-flights the doubled admin-api bot-context fetch.
-                await _guarded("auto-join", _tick)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                log.exception("auto-join tick failed")
-            await asyncio.sleep(auto_join_interval)
+        try:
+            while True:
+                try:
+                    # #637: one sweep per interval — the per-user spawn stays single-flighted by its own
+                    # xact lock, but this also single-flights the doubled admin-api bot-context fetch.
+                    await _guarded("auto-join", _tick)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    log.exception("auto-join tick failed")
+                await asyncio.sleep(auto_join_interval)
+        finally:
+            if admin_http is not None and admin_http is not http:
+                await admin_http.aclose()
 
     # Calendar sync: each sweep discovers every user with a connected ICS feed (admin-api internal
     # edge), fetches it over the SSRF-pinned transport, and upserts planned meetings (one row per
@@ -536,7 +551,7 @@ def _attach_background_loops(
         from .calendar_sync import fetch_configs, run_user_sync, store_stamp
 
         async def _tick():
-            configs = await fetch_configs(admin_api_url, internal_secret)
+            configs = await fetch_configs(admin_api_url, internal_secret, http=http)
             for cfg in configs or []:
                 try:  # one bad feed never stalls the sweep
                     stamp = await run_user_sync(transcript_store, cfg, publish=_cal_publish)
@@ -572,6 +587,8 @@ def _attach_background_loops(
             for t in tasks:
                 t.cancel()
             await asyncio.gather(*tasks, return_exceptions=True)
+            if http is not None:
+                await http.aclose()
 
     # FastAPI supports assigning .router.lifespan_context post-construction.
     app.router.lifespan_context = lifespan
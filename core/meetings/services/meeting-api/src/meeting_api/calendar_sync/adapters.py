@@ -49,17 +49,22 @@ async def fetch_ics(url: str, *, timeout_s: float = 15.0) -> tuple[Optional[str]
 
 
 async def fetch_configs(admin_api_url: str, internal_secret: str,
-                        *, timeout_s: float = 10.0) -> Optional[list[dict]]:
+                        *, timeout_s: float = 10.0, http=None) -> Optional[list[dict]]:
     """``[{user_id, ics_url, auto_join}]`` from admin-api's internal calendar-configs edge, or
-    ``None`` when identity is unreachable (the sweep skips the tick — fail-closed, not fail-silent)."""
+    ``None`` when identity is unreachable (the sweep skips the tick — fail-closed, not fail-silent).
+
+    ``http`` is an optional shared ``httpx.AsyncClient`` (the process-wide pool); without it the
+    call opens and closes its own client."""
     import httpx
 
+    url = f"{admin_api_url.rstrip('/')}/internal/calendar-configs"
+    headers = {"X-Internal-Secret": internal_secret}
     try:
-        async with httpx.AsyncClient(timeout=timeout_s) as client:
-            resp = await client.get(
-                f"{admin_api_url.rstrip('/')}/internal/calendar-configs",
-                headers={"X-Internal-Secret": internal_secret},
-            )
+        if http is not None:
+            resp = await http.get(url, headers=headers, timeout=timeout_s)
+        else:
+            async with httpx.AsyncClient(timeout=timeout_s) as client:
+                resp = await client.get(url, headers=headers)
         if resp.status_code != 200:
             return None
         body = resp.json()
@@ -112,3 +112,74 @@ async def test_boot_loop_set_excludes_dead_scheduler_tick(caplog):
     for live in ("segment-consumer", "db-writer", "webhook-drain",
                  "stop-reconcile", "auto-join", "calendar-sync"):
         assert live in line, f"{live} must still be a started loop"
+
+
+async def test_lifespan_closes_shared_http_client():
+    """The process-wide ``http`` client handed to the loops is closed when the lifespan exits."""
+    import fakeredis.aioredis
+    import httpx
+
+    from meeting_api.__main__ import _attach_background_loops
+    from meeting_api.collector.adapters import RedisStreamBus
+    from meeting_api.collector.fakes import InMemoryTranscriptStore
+
+    app = create_app()
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    http = httpx.AsyncClient()
+    _attach_background_loops(app, InMemoryTranscriptStore(), RedisStreamBus(redis), redis, http=http)
+
+    async with app.router.lifespan_context(app):
+        assert not http.is_closed
+    assert http.is_closed
+
+
+async def test_loops_send_admin_calls_through_shared_http_client(monkeypatch):
+    """Auto-join's bot-context fetch and calendar-sync's configs fetch both ride the injected pool."""
+    import asyncio
+    from datetime import datetime, timezone
+
+    import fakeredis.aioredis
+    import httpx
+
+    from meeting_api.__main__ import _attach_background_loops
+    from meeting_api.bot_spawn.fakes import FakeRuntimeClient, InMemoryMeetingRepo
+    from meeting_api.collector.adapters import RedisStreamBus
+
+    monkeypatch.setenv("ADMIN_API_URL", "http://admin")
+    monkeypatch.setenv("INTERNAL_API_SECRET", "s3cret")
+    # Park the redis-backed loops after their first tick: fakeredis swallows a cancel that lands
+    # mid-command, so shutdown must find them asleep, not inside a redis call.
+    for interval in ("SEGMENT_CONSUMER_INTERVAL", "DB_WRITER_INTERVAL_S", "WEBHOOK_DRAIN_INTERVAL",
+                     "STOP_RECONCILE_INTERVAL_S"):
+        monkeypatch.setenv(interval, "3600")
+    seen: list[str] = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        if request.url.path == "/internal/calendar-configs":
+            return httpx.Response(200, json={"configs": []})
+        return httpx.Response(200, json={"max_concurrent": 1})
+
+    repo = InMemoryMeetingRepo()
+    repo._meetings[1] = {
+        "id": 1, "user_id": USER, "platform": "google_meet",
+        "native_meeting_id": "abc-defg-hij", "platform_specific_id": "abc-defg-hij",
+        "status": "scheduled", "bot_container_id": None, "start_time": None, "end_time": None,
+        "data": {"auto_join": True, "scheduled_at": datetime.now(timezone.utc).isoformat()},
+        "created_at": "2026-07-08T09:00:00Z", "updated_at": "2026-07-08T09:00:00Z",
+    }
+    app = create_app()
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    _attach_background_loops(app, InMemoryTranscriptStore(), RedisStreamBus(redis), redis,
+                             meeting_repo=repo, runtime=FakeRuntimeClient(), http=http)
+
+    wanted = {f"/internal/users/{USER}/bot-context", "/internal/calendar-configs"}
+    async with app.router.lifespan_context(app):
+        for _ in range(500):
+            parked = {"segment-consumer", "db-writer"} <= set(app.state.pipeline_ticks)
+            if parked and wanted <= set(seen):
+                break
+            await asyncio.sleep(0.01)
+    assert wanted <= set(seen)
+    assert http.is_closed
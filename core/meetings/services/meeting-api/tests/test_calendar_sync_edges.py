@@ -111,3 +111,27 @@ def test_fetch_ics_error_taxonomy(monkeypatch, body, status, expect):
         assert err is None and text is not None
     else:
         assert text is None and expect in (err or "")
+
+
+def test_fetch_configs_goes_through_injected_client():
+    """A shared ``http`` client carries the configs fetch (no per-call client of its own)."""
+    import asyncio
+
+    import httpx
+
+    from meeting_api.calendar_sync import fetch_configs
+
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"configs": [{"user_id": 7, "ics_url": "u"}]})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            return await fetch_configs("http://admin/", "s3cret", http=http)
+
+    configs = asyncio.run(run())
+    assert configs == [{"user_id": 7, "ics_url": "u"}]
+    assert [str(r.url) for r in seen] == ["http://admin/internal/calendar-configs"]
+    assert seen[0].headers["X-Internal-Secret"] == "s3cret"
@@ -3,11 +3,9 @@ Vexa-Compatible Transcription Service (PoC)
 Implements OpenAI Whisper API format for seamless integration with Vexa
 """
 import os
-import io
 import time
 import logging
 import asyncio
-import json
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Tuple
@@ -18,6 +16,7 @@ from fastapi.responses import JSONResponse
 from fastapi.security import APIKeyHeader
 import uvicorn
 from faster_whisper import WhisperModel
+from faster_whisper.vad import get_vad_model
 # faster-whisper uses CTranslate2 internally (no PyTorch needed)
 
 # Logging
@@ -27,28 +26,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Configuration
-WORKER_ID = os.getenv("WORKER_ID", "1")
-MODEL_SIZE = os.getenv("MODEL_SIZE", "large-v3-turbo")
-
-# Device detection: Use environment variable or default to cuda for GPU containers
-# CTranslate2 (used by faster-whisper) will automatically detect and use CUDA if available
-DEVICE = os.getenv("DEVICE", "cuda")
-
-# Compute type optimization: Use INT8 for optimal VRAM efficiency
-# Research shows: large-v3-turbo + INT8 = ~2.1 GB VRAM (validated)
-# Provides 50-60% VRAM reduction with minimal accuracy loss (~1-2% WER increase)
-COMPUTE_TYPE_ENV = os.getenv("COMPUTE_TYPE", "").strip().lower()
-if COMPUTE_TYPE_ENV:
-    COMPUTE_TYPE = COMPUTE_TYPE_ENV
-else:
-    # Default to INT8 for both GPU and CPU (optimal balance of speed, memory, and accuracy)
-    COMPUTE_TYPE = "int8"
-
-# CPU threads configuration (for CPU mode optimization)
-CPU_THREADS = int(os.getenv("CPU_THREADS", "0"))  # 0 = auto-detect
-
-# Quality / decoding parameters (optional)
+# Env parsing helpers
 def _env_bool(name: str, default: bool) -> bool:
     raw = os.getenv(name, None)
     if raw is None:
@@ -75,6 +53,40 @@ def _env_float(name: str, default: float) -> float:
         logger.warning(f"Invalid float env {name}={raw!r}, using default {default}")
         return default
 
+# Configuration
+WORKER_ID = os.getenv("WORKER_ID", "1")
+
+# English-only deployments: FORCE_ENGLISH=1 defaults the model to distil-large-v3 (2 decoder
+# layers vs turbo's 4 — ~2x faster decode at near-identical English WER) and transcribes requests
+# that don't name a language as "en". An explicit MODEL_SIZE always wins.
+FORCE_ENGLISH = _env_bool("FORCE_ENGLISH", False)
+MODEL_SIZE = os.getenv("MODEL_SIZE", "").strip() or ("distil-large-v3" if FORCE_ENGLISH else "large-v3-turbo")
+
+# Device detection: Use environment variable or default to cuda for GPU containers
+# CTranslate2 (used by faster-whisper) will automatically detect and use CUDA if available
+DEVICE = os.getenv("DEVICE", "cuda")
+
+# Compute type optimization: Use INT8 for optimal VRAM efficiency
+# Research shows: large-v3-turbo + INT8 = ~2.1 GB VRAM (validated)
+# Provides 50-60% VRAM reduction with minimal accuracy loss (~1-2% WER increase)
+COMPUTE_TYPE_ENV = os.getenv("COMPUTE_TYPE", "").strip().lower()
+if COMPUTE_TYPE_ENV:
+    COMPUTE_TYPE = COMPUTE_TYPE_ENV
+else:
+    # Default to INT8 for both GPU and CPU (optimal balance of speed, memory, and accuracy)
+    COMPUTE_TYPE = "int8"
+
+# CPU threads configuration (for CPU mode optimization)
+CPU_THREADS = int(os.getenv("CPU_THREADS", "0"))  # 0 = auto-detect
+
+# Model weights: downloaded on first start into MODEL_CACHE_ROOT (the deploy unit's volume). With
+# MODEL_LOCAL_ONLY=1 the model is resolved from BAKED_MODEL_ROOT only — the image path the Dockerfile's
+# PREFETCH_MODEL bakes into, outside the volume so a populated volume can't hide it — and never
+# fetched from the HF hub. A missing model then fails startup instead of stalling on a download.
+MODEL_CACHE_ROOT = "/app/models"
+BAKED_MODEL_ROOT = "/opt/models"
+MODEL_LOCAL_ONLY = _env_bool("MODEL_LOCAL_ONLY", False)
+
 # Transcription defaults (can be overridden via env)
 BEAM_SIZE = _env_int("BEAM_SIZE", 5)
 BEST_OF = _env_int("BEST_OF", 5)
@@ -92,6 +104,10 @@ VAD_FILTER_THRESHOLD = _env_float("VAD_FILTER_THRESHOLD", 0.5)
 VAD_MIN_SILENCE_DURATION_MS = _env_int("VAD_MIN_SILENCE_DURATION_MS", 160)
 VAD_MAX_SPEECH_DURATION_S = _env_float("VAD_MAX_SPEECH_DURATION_S", 15.0)  # max segment length before forced split
 
+# Uploads whose RMS level is below this are answered as silence without running the model
+# (0.001 ≈ -60 dBFS). 0 disables the check.
+SILENCE_RMS_THRESHOLD = _env_float("SILENCE_RMS_THRESHOLD", 0.001)
+
 # Temperature fallback chain
 USE_TEMPERATURE_FALLBACK = _env_bool("USE_TEMPERATURE_FALLBACK", False)
 TEMPERATURE_FALLBACK_CHAIN = [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
@@ -117,6 +133,22 @@ def _looks_like_hallucination(segments: List[Dict[str, Any]]) -> bool:
             return True
     return False
 
+# Frames sampled (evenly across the whole file) to decide whether a multi-channel upload is
+# duplicated mono.
+_MONO_PROBE_FRAMES = 16000
+
+def _to_mono(audio_array: np.ndarray) -> np.ndarray:
+    """Downmix a (frames, channels) array to mono.
+
+    Bot pipelines often upload duplicated mono as stereo. When a strided probe across the whole
+    file shows every channel equal to channel 0, keep channel 0 instead of averaging.
+    """
+    step = max(1, audio_array.shape[0] // _MONO_PROBE_FRAMES)
+    probe = audio_array[::step]
+    if np.allclose(probe, probe[:, :1], rtol=0.0, atol=1e-4):
+        return audio_array[:, 0]
+    return np.mean(audio_array, axis=1)
+
 # API Token Authentication
 API_TOKEN = os.getenv("API_TOKEN", "").strip()
 API_KEY_HEADER = APIKeyHeader(name="X-API-Key", auto_error=False)
@@ -142,7 +174,10 @@ async def verify_api_token(
         if token == API_TOKEN:
             return True
     
-    logger.warning(f"Invalid or missing API token - X-API-Key: {api_key is not None}, Authorization: {bool(auth_header)}")
+    logger.warning(
+        "Invalid or missing API token - X-API-Key: %s, Authorization: %s",
+        api_key is not None, bool(auth_header),
+    )
     raise HTTPException(
         status_code=401,
         detail="Invalid or missing API token"
@@ -211,7 +246,7 @@ async def startup_event():
     """Initialize Whisper model on startup"""
     global model
     logger.info(f"Worker {WORKER_ID} starting up...")
-    logger.info(f"Device: {DEVICE}, Model: {MODEL_SIZE}, Compute: {COMPUTE_TYPE}")
+    logger.info(f"Device: {DEVICE}, Model: {MODEL_SIZE}, Compute: {COMPUTE_TYPE}, Local only: {MODEL_LOCAL_ONLY}")
     logger.info(
         "Quality params - "
         f"beam_size={BEAM_SIZE}, best_of={BEST_OF}, "
@@ -230,8 +265,11 @@ async def startup_event():
             "model_size_or_path": MODEL_SIZE,
             "device": DEVICE,
             "compute_type": COMPUTE_TYPE,
-            "download_root": "/app/models"
+            "download_root": MODEL_CACHE_ROOT,
         }
+        if MODEL_LOCAL_ONLY:
+            model_kwargs["download_root"] = BAKED_MODEL_ROOT
+            model_kwargs["local_files_only"] = True
         
         # Add CPU threads for CPU mode (optimization from research)
         if DEVICE == "cpu" and CPU_THREADS > 0:
@@ -239,11 +277,22 @@ async def startup_event():
             logger.info(f"Worker {WORKER_ID} using {CPU_THREADS} CPU threads")
         
         model = WhisperModel(**model_kwargs)
-        logger.info(f"Worker {WORKER_ID} ready - Model loaded successfully")
     except Exception as e:
         logger.error(f"Failed to load model: {e}")
         raise
 
+    # Silero VAD (onnxruntime) is built lazily on the first vad_filter=True call and cached
+    # for the process; build it here so the first request doesn't pay the session setup.
+    # Best-effort: a failed warm-up is not cached, so the first request retries it lazily.
+    if VAD_FILTER:
+        try:
+            get_vad_model()
+            logger.info(f"Worker {WORKER_ID} VAD model warmed up")
+        except Exception as e:
+            logger.warning(f"VAD warm-up failed, falling back to lazy init: {e}")
+
+    logger.info(f"Worker {WORKER_ID} ready - Model loaded successfully")
+
 
 @app.get("/health")
 async def health_check():
@@ -329,8 +378,8 @@ async def transcribe_audio(
             )
         if waiting_requests >= MAX_QUEUE_SIZE:
             logger.warning(
-                f"Worker {WORKER_ID} queue full ({waiting_requests}/{MAX_QUEUE_SIZE}). "
-                f"Rejecting request with 503."
+                "Worker %s queue full (%d/%d). Rejecting request with 503.",
+                WORKER_ID, waiting_requests, MAX_QUEUE_SIZE,
             )
             raise HTTPException(
                 status_code=503,
@@ -359,26 +408,29 @@ async def transcribe_audio(
         
         start_time = time.time()
         logger.info(
-            f"Worker {WORKER_ID} received transcription request - "
-            f"tier={transcription_tier}, filename: {file.filename}, content_type: {file.content_type}"
+            "Worker %s received transcription request - tier=%s, filename: %s, content_type: %s",
+            WORKER_ID, transcription_tier, file.filename, file.content_type,
         )
-        # Read audio file
-        audio_bytes = await file.read()
-        logger.info(f"Worker {WORKER_ID} read {len(audio_bytes)} bytes of audio data")
+        # The multipart parser has already spooled the upload (in memory up to 1 MB, on disk
+        # beyond); decode straight from that file instead of copying the body into bytes first.
+        audio_file = file.file
+        audio_file.seek(0)
+        logger.info("Worker %s received upload of %s bytes", WORKER_ID, file.size)
         
         # Convert to format suitable for faster-whisper
         # Use soundfile to properly decode audio formats (WAV, MP3, etc.)
         # Falls back to ffmpeg subprocess for formats soundfile can't handle (webm, opus, etc.)
-        audio_io = io.BytesIO(audio_bytes)
         try:
-            audio_array, sample_rate = sf.read(audio_io, dtype=np.float32)
-            logger.info(f"Worker {WORKER_ID} decoded audio - shape: {audio_array.shape}, sample_rate: {sample_rate}")
+            audio_array, sample_rate = sf.read(audio_file, dtype=np.float32)
+            logger.info("Worker %s decoded audio - shape: %s, sample_rate: %s", WORKER_ID, audio_array.shape, sample_rate)
         except Exception as e:
-            logger.warning(f"Worker {WORKER_ID} soundfile failed ({e}), trying ffmpeg fallback")
+            logger.warning("Worker %s soundfile failed (%s), trying ffmpeg fallback", WORKER_ID, e)
             try:
                 import subprocess, tempfile
+                import shutil
+                audio_file.seek(0)
                 with tempfile.NamedTemporaryFile(suffix='.webm', delete=False) as tmp_in:
-                    tmp_in.write(audio_bytes)
+                    shutil.copyfileobj(audio_file, tmp_in)
                     tmp_in_path = tmp_in.name
                 tmp_out_path = tmp_in_path.replace('.webm', '.wav')
                 result = subprocess.run(
@@ -388,25 +440,43 @@ async def transcribe_audio(
                 if result.returncode != 0:
                     raise RuntimeError(f"ffmpeg failed: {result.stderr.decode()[:500]}")
                 audio_array, sample_rate = sf.read(tmp_out_path, dtype=np.float32)
-                logger.info(f"Worker {WORKER_ID} decoded via ffmpeg - shape: {audio_array.shape}, sample_rate: {sample_rate}")
+                logger.info("Worker %s decoded via ffmpeg - shape: %s, sample_rate: %s", WORKER_ID, audio_array.shape, sample_rate)
                 import os
                 os.unlink(tmp_in_path)
                 os.unlink(tmp_out_path)
             except FileNotFoundError:
-                logger.error(f"Worker {WORKER_ID} ffmpeg not installed - cannot decode non-WAV formats")
+                logger.error("Worker %s ffmpeg not installed - cannot decode non-WAV formats", WORKER_ID)
                 raise HTTPException(status_code=400, detail=f"Failed to decode audio file: {e}. Install ffmpeg for webm/opus support.")
             except Exception as e2:
-                logger.error(f"Worker {WORKER_ID} ffmpeg fallback also failed: {e2}")
+                logger.error("Worker %s ffmpeg fallback also failed: %s", WORKER_ID, e2)
                 raise HTTPException(status_code=400, detail=f"Failed to decode audio file: {e2}")
         
         # Ensure mono audio (convert stereo to mono if needed)
-        if len(audio_array.shape) > 1:
-            audio_array = np.mean(audio_array, axis=1)
-            logger.info(f"Worker {WORKER_ID} converted to mono - shape: {audio_array.shape}")
+        if audio_array.ndim > 1:
+            audio_array = _to_mono(audio_array)
+            logger.info("Worker %s converted to mono - shape: %s", WORKER_ID, audio_array.shape)
         
-        # Ensure audio is contiguous array
-        audio_array = np.ascontiguousarray(audio_array, dtype=np.float32)
+        # faster-whisper wants a C-contiguous float32 array. Decoding and the mono downmix already
+        # produce one, so only copy when handed a strided view or another dtype.
+        if audio_array.dtype != np.float32 or not audio_array.flags["C_CONTIGUOUS"]:
+            audio_array = np.ascontiguousarray(audio_array, dtype=np.float32)
         
+        if FORCE_ENGLISH and not language:
+            language = "en"
+
+        # Near-silent windows (muted mic, missed speech) can't yield a transcript — answer them
+        # without a model pass. One dot product: no temporary array.
+        rms = float(np.sqrt(np.dot(audio_array, audio_array) / audio_array.size)) if audio_array.size else 0.0
+        if rms < SILENCE_RMS_THRESHOLD:
+            logger.info("Worker %s skipped near-silent audio (rms=%.6f)", WORKER_ID, rms)
+            return {
+                "text": "",
+                "language": language or "unknown",
+                "language_probability": 0.0,
+                "duration": audio_array.size / sample_rate,
+                "segments": [],
+            }
+
         # Transcribe (with optional temperature fallback)
         requested_temp = float(temperature) if temperature else 0.0
         temps = TEMPERATURE_FALLBACK_CHAIN if USE_TEMPERATURE_FALLBACK else [requested_temp]
@@ -417,9 +487,9 @@ async def transcribe_audio(
         req_min_silence = int(min_silence_duration_ms) if min_silence_duration_ms else VAD_MIN_SILENCE_DURATION_MS
 
         logger.info(
-            f"Worker {WORKER_ID} starting transcription - requested_temp: {requested_temp}, "
-            f"temps: {temps}, language: {language}, task: {task}, vad_filter: {VAD_FILTER}, "
-            f"max_speech={req_max_speech}s, min_silence={req_min_silence}ms"
+            "Worker %s starting transcription - requested_temp: %s, temps: %s, language: %s, "
+            "task: %s, vad_filter: %s, max_speech=%ss, min_silence=%sms",
+            WORKER_ID, requested_temp, temps, language, task, VAD_FILTER, req_max_speech, req_min_silence,
         )
 
         best: Optional[Tuple[str, str, float, List[Dict[str, Any]]]] = None
@@ -485,7 +555,7 @@ async def transcribe_audio(
 
             if _looks_like_silence(segments):
                 best = ("", info.language, getattr(info, 'language_probability', 0.0), 0.0, [])
-                logger.info(f"Worker {WORKER_ID} detected silence (temp={t})")
+                logger.info("Worker %s detected silence (temp=%s)", WORKER_ID, t)
                 break
 
             is_hallucination = _looks_like_hallucination(segments)
@@ -494,10 +564,10 @@ async def transcribe_audio(
                 full_text = " ".join([s["text"].strip() for s in segments]).strip()
                 duration = segments[-1]["end"] if segments else 0.0
                 best = (full_text, info.language, getattr(info, 'language_probability', 0.0), duration, segments)
-                logger.info(f"Worker {WORKER_ID} accepted transcription (temp={t})")
+                logger.info("Worker %s accepted transcription (temp=%s)", WORKER_ID, t)
                 break
             else:
-                logger.info(f"Worker {WORKER_ID} rejected transcription as hallucination/low-confidence (temp={t})")
+                logger.info("Worker %s rejected transcription as hallucination/low-confidence (temp=%s)", WORKER_ID, t)
 
         if best is None:
             # Fall back to last attempt (even if it looks low-quality) to preserve backward behavior.
@@ -509,12 +579,15 @@ async def transcribe_audio(
             best = (full_text, info.language if info else (language or "unknown"), lang_prob, duration, segments)
 
         full_text, detected_language, detected_language_probability, duration, segments = best
-        logger.info(f"Worker {WORKER_ID} transcription completed - language: {detected_language}, language_probability: {detected_language_probability}")
+        logger.info(
+            "Worker %s transcription completed - language: %s, language_probability: %s",
+            WORKER_ID, detected_language, detected_language_probability,
+        )
         
         processing_time = time.time() - start_time
         logger.info(
-            f"Worker {WORKER_ID} completed in {processing_time:.2f}s - "
-            f"Duration: {duration:.2f}s, Segments: {len(segments)}, Language: {detected_language}"
+            "Worker %s completed in %.2fs - Duration: %.2fs, Segments: %d, Language: %s",
+            WORKER_ID, processing_time, duration, len(segments), detected_language,
         )
         
         # Return format expected by Vexa RemoteTranscriber
@@ -534,7 +607,7 @@ async def transcribe_audio(
         # Re-raise HTTP exceptions (429, 503, etc.)
         raise
     except Exception as e:
-        logger.error(f"Worker {WORKER_ID} transcription failed: {e}", exc_info=True)
+        logger.error("Worker %s transcription failed: %s", WORKER_ID, e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         # Keep counters and semaphore balanced even on early failures.
@@ -3,11 +3,18 @@
 The faster-whisper model is loaded lazily (on first use / startup), NOT at import, and
 `TestClient(app)` without the `with` block does not run lifespan — so the suite exercises
 the HTTP contract (health states, auth, validation) against the real app with `model` left
-unloaded or replaced by a sentinel.
+unloaded, replaced by a sentinel, or replaced by a recording ``FakeModel`` (``fake_model``), fed
+WAV bodies built by ``wav_bytes``.
 """
 from __future__ import annotations
 
+import io
+from types import SimpleNamespace
+from typing import Callable
+
+import numpy as np
 import pytest
+import soundfile as sf
 from fastapi.testclient import TestClient
 
 import transcription.main as svc
@@ -23,3 +30,60 @@ def loaded(monkeypatch):
     """Pretend the model is loaded (a non-None sentinel) without touching faster-whisper."""
     monkeypatch.setattr(svc, "model", object())
     return svc
+
+
+class FakeModel:
+    """Stands in for ``WhisperModel``: records every ``transcribe`` call (audio, kwargs) and replies
+    with one " hello" segment, echoing the requested language."""
+
+    def __init__(self):
+        self.calls: list[tuple[np.ndarray, dict]] = []
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append((audio, kwargs))
+        seg = SimpleNamespace(
+            start=0.0, end=1.0, text=" hello", avg_logprob=-0.1,
+            compression_ratio=1.0, no_speech_prob=0.01, words=None,
+        )
+        return [seg], SimpleNamespace(language=kwargs.get("language") or "en", language_probability=0.99)
+
+
+@pytest.fixture
+def fake_model(monkeypatch) -> FakeModel:
+    """An open (no API_TOKEN) worker whose model is a recording ``FakeModel``."""
+    model = FakeModel()
+    monkeypatch.setattr(svc, "API_TOKEN", "")
+    monkeypatch.setattr(svc, "model", model)
+    return model
+
+
+@pytest.fixture
+def tone() -> np.ndarray:
+    """One second of a 440 Hz tone at 16 kHz — audible, so it clears the silence gate."""
+    return (0.1 * np.sin(np.linspace(0, 2 * np.pi * 440, 16000))).astype(np.float32)
+
+
+@pytest.fixture
+def wav_bytes() -> Callable[..., bytes]:
+    """Encode float32 samples (mono, or frames x channels) as a float WAV upload body."""
+
+    def _encode(samples: np.ndarray, sample_rate: int = 16000) -> bytes:
+        buf = io.BytesIO()
+        sf.write(buf, samples, sample_rate, format="WAV", subtype="FLOAT")
+        return buf.getvalue()
+
+    return _encode
+
+
+@pytest.fixture
+def transcribe(client):
+    """POST a WAV body to the OpenAI-compatible endpoint with the given form fields."""
+
+    def _post(wav: bytes, **form):
+        return client.post(
+            "/v1/audio/transcriptions",
+            files={"file": ("a.wav", wav, "audio/wav")},
+            data={"model": "large-v3-turbo", **form},
+        )
+
+    return _post
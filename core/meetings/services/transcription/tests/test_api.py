@@ -2,7 +2,8 @@
 
 The happy path (real model inference) is a GPU/integration concern, exercised by the deploy
 unit's smoke, not the unit gate. Here we pin the seam the bot's whisper client relies on:
-token auth and multipart validation, both reachable without loading a model.
+token auth and multipart validation, both reachable without loading a model, plus the
+upload-decode → model hand-off with the model faked.
 """
 from __future__ import annotations
 
@@ -27,3 +28,73 @@ def test_transcribe_rejects_missing_file(client, monkeypatch):
     monkeypatch.setattr(svc, "API_TOKEN", "")
     r = client.post("/v1/audio/transcriptions", data={"model": "large-v3-turbo"})
     assert r.status_code == 422
+
+
+def test_transcribe_decodes_upload_and_returns_segments(fake_model, transcribe, tone, wav_bytes):
+    import numpy as np
+
+    r = transcribe(wav_bytes(tone))
+    assert r.status_code == 200
+    assert r.json()["text"] == "hello"
+    audio, _ = fake_model.calls[0]
+    assert audio.dtype == np.float32
+    np.testing.assert_array_equal(audio, tone)
+
+
+def test_transcribe_decodes_upload_spooled_to_disk(fake_model, transcribe, tone, wav_bytes):
+    import numpy as np
+
+    # 10 s of duplicated-channel stereo float WAV ≈ 1.3 MB: past the multipart parser's 1 MB
+    # in-memory spool, so the decode reads the on-disk spool file.
+    signal = np.tile(tone, 10)
+    body = wav_bytes(np.stack([signal, signal], axis=1))
+    assert len(body) > 1024 * 1024
+    r = transcribe(body)
+    assert r.status_code == 200
+    audio, _ = fake_model.calls[0]
+    np.testing.assert_array_equal(audio, signal)
+
+
+def test_force_english_defaults_language_but_keeps_explicit(fake_model, transcribe, tone, wav_bytes, monkeypatch):
+    import transcription.main as svc
+
+    monkeypatch.setattr(svc, "FORCE_ENGLISH", True)
+    assert transcribe(wav_bytes(tone)).status_code == 200
+    assert transcribe(wav_bytes(tone), language="de").status_code == 200
+    # No language named → forced to "en"; an explicit request language is kept.
+    assert [kwargs["language"] for _, kwargs in fake_model.calls] == ["en", "de"]
+
+
+def test_transcribe_short_circuits_silence_without_model(fake_model, transcribe, wav_bytes):
+    import numpy as np
+
+    r = transcribe(wav_bytes(np.zeros(8000, dtype=np.float32)), language="de")
+    assert r.status_code == 200
+    assert fake_model.calls == []  # the model never ran
+    body = r.json()
+    assert body["text"] == "" and body["segments"] == []
+    assert body["language"] == "de"
+    assert body["duration"] == 0.5
+
+
+def test_silence_threshold_zero_always_runs_the_model(fake_model, transcribe, wav_bytes, monkeypatch):
+    import numpy as np
+
+    import transcription.main as svc
+
+    monkeypatch.setattr(svc, "SILENCE_RMS_THRESHOLD", 0.0)
+    r = transcribe(wav_bytes(np.zeros(8000, dtype=np.float32)))
+    assert r.status_code == 200
+    assert len(fake_model.calls) == 1  # the gate is off: even all-zero audio reaches the model
+
+
+def test_to_mono_keeps_channel_zero_for_duplicated_stereo():
+    import numpy as np
+
+    import transcription.main as svc
+
+    ch = np.linspace(-0.5, 0.5, 48000, dtype=np.float32)
+    np.testing.assert_array_equal(svc._to_mono(np.stack([ch, ch], axis=1)), ch)
+    # Distinct channels are still averaged.
+    mixed = svc._to_mono(np.stack([ch, np.zeros_like(ch)], axis=1))
+    np.testing.assert_allclose(mixed, ch / 2)
@@ -0,0 +1,63 @@
+"""Startup model load — the kwargs handed to faster-whisper, with the model class faked out.
+
+No weights are loaded: ``WhisperModel`` and the VAD warm-up are replaced by recorders, so this
+pins how env config becomes the model constructor call.
+"""
+from __future__ import annotations
+
+import pytest
+
+import transcription.main as svc
+
+
+@pytest.fixture
+def vad_calls(monkeypatch):
+    calls: list[None] = []
+    monkeypatch.setattr(svc, "get_vad_model", lambda: calls.append(None))
+    return calls
+
+
+@pytest.fixture
+def whisper_ctor(monkeypatch, vad_calls):
+    calls: list[dict] = []
+
+    def _whisper_model(**kwargs):
+        calls.append(kwargs)
+        return object()
+
+    monkeypatch.setattr(svc, "WhisperModel", _whisper_model)
+    monkeypatch.setattr(svc, "model", None)
+    return calls
+
+
+async def test_startup_downloads_by_default(whisper_ctor, monkeypatch):
+    monkeypatch.setattr(svc, "MODEL_LOCAL_ONLY", False)
+    await svc.startup_event()
+    assert svc.model is not None
+    assert "local_files_only" not in whisper_ctor[0]
+    assert whisper_ctor[0]["download_root"] == "/app/models"
+
+
+async def test_startup_local_only_never_hits_hub(whisper_ctor, monkeypatch):
+    monkeypatch.setattr(svc, "MODEL_LOCAL_ONLY", True)
+    await svc.startup_event()
+    assert whisper_ctor[0]["local_files_only"] is True
+    # the baked image path, not the /app/models volume that would shadow it
+    assert whisper_ctor[0]["download_root"] == "/opt/models"
+
+
+@pytest.mark.parametrize("vad_filter", [True, False])
+async def test_startup_warms_vad_only_when_filtering(whisper_ctor, vad_calls, monkeypatch, vad_filter):
+    monkeypatch.setattr(svc, "VAD_FILTER", vad_filter)
+    await svc.startup_event()
+    assert len(vad_calls) == (1 if vad_filter else 0)
+
+
+async def test_startup_survives_vad_warmup_failure(whisper_ctor, monkeypatch):
+    def _broken_vad():
+        raise RuntimeError("onnxruntime session failed")
+
+    monkeypatch.setattr(svc, "VAD_FILTER", True)
+    monkeypatch.setattr(svc, "get_vad_model", _broken_vad)
+    await svc.startup_event()  # the warm-up is best-effort: the first request retries it lazily
+    assert svc.model is not None